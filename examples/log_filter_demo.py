@@ -1,3 +1,4 @@
+import os
 import sys
 import logging
 from tz_logging.core import TzLogger, StreamHandlerConfig
@@ -8,10 +9,14 @@ logger_instance.logger.setLevel(logging.DEBUG)  # Ensure all levels are allowed
 
 # Step 2: Define custom filters
 
+def _record_message(record):
+    """Returns the record's message, skipping %-interpolation when it has no args."""
+    return record.msg if not record.args else record.getMessage()
+
 class ErrorTypeFilter(logging.Filter):
     """Allows only log messages related to a specific error type (ValueError)."""
     def filter(self, record):
-        return "ValueError" in record.getMessage()  # Only logs mentioning ValueError will pass
+        return "ValueError" in _record_message(record)  # Only logs mentioning ValueError will pass
 
 class KeywordFilter(logging.Filter):
     """Allows only log messages containing a specific keyword."""
@@ -20,29 +25,38 @@ class KeywordFilter(logging.Filter):
         self.keyword = keyword
 
     def filter(self, record):
-        return self.keyword in record.getMessage()
+        return self.keyword in _record_message(record)
 
 class FileFilter(logging.Filter):
     """Filters log messages coming from a specific file (log_filter_demo.py)."""
+    def __init__(self):
+        super().__init__()
+        # Precompute the absolute path once; comparing whole paths is cheaper
+        # than a substring search per record.
+        self._needle = os.path.abspath(__file__)
+
     def filter(self, record):
-        return "log_filter_demo.py" in record.pathname  # Only logs from this file pass
+        return record.pathname == self._needle  # Only logs from this file pass
 
 # Step 3: Create handlers with filters
 
+# add_stream_handler returns the created handler, so bind it locally instead
+# of re-fetching it through logger_instance.logger.handlers[-1].
+
 # 🟢 Handler 1: Only logs messages containing "ValueError"
 error_filter_handler = StreamHandlerConfig(stream=sys.stdout, level=logging.DEBUG, format_str=TzLogger.FORMAT_STANDARD)
-logger_instance.add_stream_handler(error_filter_handler)
-logger_instance.logger.handlers[-1].addFilter(ErrorTypeFilter())
+error_handler = logger_instance.add_stream_handler(error_filter_handler)
+error_handler.addFilter(ErrorTypeFilter())
 
 # 🟡 Handler 2: Only logs messages containing "critical_issue"
 keyword_filter_handler = StreamHandlerConfig(stream=sys.stdout, level=logging.DEBUG, format_str=TzLogger.FORMAT_STANDARD)
-logger_instance.add_stream_handler(keyword_filter_handler)
-logger_instance.logger.handlers[-1].addFilter(KeywordFilter("critical_issue"))
+keyword_handler = logger_instance.add_stream_handler(keyword_filter_handler)
+keyword_handler.addFilter(KeywordFilter("critical_issue"))
 
 # 🔵 Handler 3: Only logs messages coming from this script (log_filter_demo.py)
 file_filter_handler = StreamHandlerConfig(stream=sys.stdout, level=logging.DEBUG, format_str=TzLogger.FORMAT_STANDARD)
-logger_instance.add_stream_handler(file_filter_handler)
-logger_instance.logger.handlers[-1].addFilter(FileFilter())
+file_handler = logger_instance.add_stream_handler(file_filter_handler)
+file_handler.addFilter(FileFilter())
 
 # Step 4: Log test messages
 
@@ -13,20 +13,19 @@ logger_instance.logger.setLevel(logging.DEBUG)
 
 # 🟢 FORMAT_DETAILED: Includes file name, function, and line number
 detailed_config = StreamHandlerConfig(stream=sys.stdout, level=logging.DEBUG, format_str=TzLogger.FORMAT_DETAILED)
-logger_instance.add_stream_handler(detailed_config)
 
 # 🟡 FORMAT_STANDARD: More concise but still includes location details
 standard_config = StreamHandlerConfig(stream=sys.stdout, level=logging.INFO, format_str=TzLogger.FORMAT_STANDARD)
-logger_instance.add_stream_handler(standard_config)
 
 # 🔵 FORMAT_SIMPLE: Minimal log format, just level, timestamp, and message
 simple_config = StreamHandlerConfig(stream=sys.stdout, level=logging.WARNING, format_str=TzLogger.FORMAT_SIMPLE)
-logger_instance.add_stream_handler(simple_config)
 
 # 🔴 Custom Format: Adding a thread name and module name to the log format
 CUSTOM_FORMAT = "[%(levelname)s] %(asctime)s [%(threadName)s] [%(module)s]: %(message)s"
 custom_config = StreamHandlerConfig(stream=sys.stdout, level=logging.ERROR, format_str=CUSTOM_FORMAT)
-logger_instance.add_stream_handler(custom_config)
+
+# Add all four handlers in a single bulk call
+logger_instance.add_handlers([detailed_config, standard_config, simple_config, custom_config])
 
 # Step 4: Log messages at different levels to see how they appear in each format
 logger_instance.logger.debug("DEBUG - This message appears only in detailed format.")
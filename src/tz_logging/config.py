@@ -2,11 +2,11 @@
 """
 from dataclasses import dataclass
 import logging
-from typing import Optional
+from typing import Optional, TextIO
 import sys
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RotatingFileHandlerConfig:
     """Config for for rotating file handler.
     """
@@ -16,13 +16,13 @@ class RotatingFileHandlerConfig:
     level: int = logging.INFO
     format_str: Optional[str] = None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StreamHandlerConfig:
-    def __init__(self, stream=sys.stdout, level=logging.INFO, format_str=None):
-        self.stream = stream
-        self.level = level
-        self.format_str = format_str
+    """Config for stream handler.
+    """
+    stream: TextIO = sys.stdout
+    level: int = logging.INFO
+    format_str: Optional[str] = None
 
     def __repr__(self):
         return f"StreamHandlerConfig(stream={self.stream}, level={self.level}, format_str={self.format_str})"
-
@@ -2,14 +2,110 @@
 Module providing the ability to quickly set up and configure logging.
 """
 
+import atexit
+import copy
+import json
 import logging
 import logging.config
 import os
-from logging.handlers import RotatingFileHandler
-from typing import Optional
-import yaml
+import queue
+import re
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Iterable, Optional, Union
 from .config import RotatingFileHandlerConfig, StreamHandlerConfig
 
+# PyYAML is imported lazily so merely importing tz_logging stays cheap for
+# applications that never load a YAML config.
+_YAML_MODULE = None
+_YAML_LOADER = None
+
+
+def _yaml():
+    """Imports PyYAML on first use and picks the fastest available loader
+    (libyaml-backed CSafeLoader, falling back to the pure-Python SafeLoader)."""
+    global _YAML_MODULE, _YAML_LOADER
+    if _YAML_MODULE is None:
+        import yaml as yaml_module
+        _YAML_LOADER = getattr(yaml_module, "CSafeLoader", yaml_module.SafeLoader)
+        _YAML_MODULE = yaml_module
+    return _YAML_MODULE
+
+# Parsed YAML configs keyed by (path, mtime, size) so reloading an unchanged
+# file skips the parse entirely. Bounded so long-running processes that churn
+# through many config rewrites cannot grow it without limit; dicts preserve
+# insertion order, so eviction drops the oldest parse first.
+_YAML_CACHE: dict = {}
+_YAML_CACHE_MAX = 100
+
+# Library status messages go through this logger instead of print(), so they
+# never take the stdout lock or issue a syscall unless a handler wants them.
+_internal_logger = logging.getLogger("tz_logging.internal")
+
+# Compile-time log level floor, read from the environment once at import.
+# TzLogger level methods below this threshold are rebound to a no-op, so a
+# suppressed call costs a plain function call instead of a full logging call.
+TZ_MAX_LOG_LEVEL = int(os.getenv("TZ_MAX_LOG_LEVEL", "0"))
+
+
+def _noop(*args, **kwargs) -> None:
+    """No-op replacement for log methods stripped by TZ_MAX_LOG_LEVEL."""
+
+
+def _enable_fast_handle(handler: logging.Handler) -> None:
+    """
+    Installs a fast-path handle() on a filterless handler that skips the
+    filter-chain iteration logging.Handler.handle performs per record. The
+    stock path is restored automatically the moment a filter is added.
+    """
+    if handler.filters:
+        return
+
+    def fast_handle(record):
+        # Level gating already happened in Logger.callHandlers (or the queue
+        # listener); with no filters there is nothing left to check.
+        handler.acquire()
+        try:
+            handler.emit(record)
+        finally:
+            handler.release()
+        return record
+
+    original_add_filter = handler.addFilter
+
+    def add_filter(log_filter):
+        # First filter added: drop back to the stock filtering handle().
+        handler.__dict__.pop("handle", None)
+        handler.__dict__.pop("addFilter", None)
+        original_add_filter(log_filter)
+
+    handler.handle = fast_handle
+    handler.addFilter = add_filter
+
+
+def _record_message(record: logging.LogRecord) -> str:
+    """
+    Returns the record's final message text, interpolating args at most once.
+
+    No-arg records return record.msg directly; records with args cache the
+    interpolated result on record.message so a chain of filters (and multiple
+    handlers) formats the message a single time.
+    """
+    if not record.args and isinstance(record.msg, str):
+        return record.msg
+    message = record.__dict__.get("message")
+    if message is None:
+        message = record.getMessage()
+        record.message = message
+    return message
+
+
+def _unknown_caller(stack_info=False, stacklevel=1):
+    """Stand-in for Logger.findCaller when no format needs caller info,
+    skipping the sys._getframe walk per record."""
+    return ("(unknown file)", 0, "(unknown function)", None)
+
+
 class KeywordFilter(logging.Filter):
     """
     A filter that allows logging messages containing (positive) or excluding (negative) a given keyword.
@@ -28,8 +124,126 @@ class KeywordFilter(logging.Filter):
 
     def filter(self, record):
         """Filters log records based on keyword presence."""
-        message_contains_keyword = self.keyword in record.getMessage()
-        return message_contains_keyword if self.positive else not message_contains_keyword
+        return (self.keyword in _record_message(record)) == self.positive
+
+
+class CoalescedKeywordFilter(logging.Filter):
+    """
+    A filter that tests several literal keywords with one compiled alternation
+    regex, so a chain of same-polarity keyword filters costs a single regex
+    search per record instead of one substring scan per keyword.
+    """
+    def __init__(self, keywords, positive: bool = True):
+        """
+        Initializes the filter.
+
+        Args:
+            keywords (Iterable[str]): The keywords to match against messages.
+            positive (bool): If True, only logs containing any keyword will be
+                             shown. If False, logs containing any keyword will
+                             be hidden.
+        """
+        self.keywords = tuple(keywords)
+        self.positive = positive
+        self._search = re.compile("|".join(map(re.escape, self.keywords))).search
+
+    def filter(self, record):
+        """Filters log records based on the presence of any keyword."""
+        return (self._search(_record_message(record)) is not None) == self.positive
+
+
+class _CachingFormatter(logging.Formatter):
+    """
+    A Formatter that caches its output on the record itself, keyed per
+    formatter instance. Handlers that share one cached formatter (see
+    TzLogger._get_formatter) then format each record exactly once instead of
+    once per handler.
+    """
+
+    def format(self, record):
+        # Formatter instances live forever in the cache, so id(self) is a
+        # stable key for this formatter's output on the record.
+        key = f"_tz_fmt_{id(self)}"
+        cached = record.__dict__.get(key)
+        if cached is None:
+            cached = super().format(record)
+            record.__dict__[key] = cached
+        return cached
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    A RotatingFileHandler that writes through a large buffer and skips the
+    per-record flush, collapsing many small write syscalls into few large
+    ones. The buffer is flushed when the file rolls over and when the handler
+    is closed.
+    """
+
+    BUFFER_SIZE = 128 * 1024
+
+    # Whether baseFilename is a regular file, checked once per open so
+    # shouldRollover need not stat() the path on every emit.
+    _is_regular_file = True
+
+    # Running size of the current log file in bytes, maintained per write.
+    # Seeking or telling on the stream would flush the write buffer, so the
+    # size check in shouldRollover must never touch the stream itself.
+    _size = 0
+
+    # Encoding the stream actually writes with, captured in _open so the
+    # running size counts encoded bytes like maxBytes and getsize do.
+    _write_encoding = "utf-8"
+
+    def _open(self):
+        """Opens the log file with a large write buffer."""
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        self._is_regular_file = os.path.isfile(self.baseFilename)
+        self._size = os.path.getsize(self.baseFilename) if self._is_regular_file else 0
+        self._write_encoding = stream.encoding or "utf-8"
+        return stream
+
+    def shouldRollover(self, record):
+        """
+        Determines if rollover should occur, without the per-record
+        os.path.exists/os.path.isfile stat calls the stdlib version makes or
+        its seek(0, 2), which would flush the write buffer every record. The
+        never-roll-over-special-files guard (bpo-45401) is preserved via the
+        check done once in _open().
+        """
+        if self.stream is None:  # delay was set...
+            self.stream = self._open()
+        if not self._is_regular_file:
+            return False
+        if self.maxBytes > 0:
+            # The cached formatter makes this format() call essentially free
+            # when emit() formats the same record right after. Compare in
+            # encoded bytes, since that is what ends up on disk.
+            msg = self.format(record) + self.terminator
+            msg_bytes = len(msg.encode(self._write_encoding, self.errors or "strict"))
+            if self._size + msg_bytes >= self.maxBytes:
+                return True
+        return False
+
+    def emit(self, record):
+        """Emits a record without the per-record flush of StreamHandler.emit."""
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            self._size += len(msg.encode(self._write_encoding, self.errors or "strict"))
+        except RecursionError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
 
 
 class TzLogger:
@@ -39,6 +253,20 @@ class TzLogger:
     """
 
     FORMAT_DETAILED = (
+        "------------------------------------\n"
+        "   Logging Level: %(levelname)s\n"
+        " - Time:          %(asctime)s\n"
+        " - File:          %(filename)s\n"
+        " - Function:      %(funcName)s\n"
+        " - Line Number:   %(lineno)d\n"
+        " - Message:       %(message)s\n"
+        "------------------------------------"
+    )
+
+    # Like FORMAT_DETAILED but with the absolute path of the source file, for
+    # users who need more than the bare file name (at the cost of longer
+    # records).
+    FORMAT_DETAILED_FULLPATH = (
         "------------------------------------\n"
         "   Logging Level: %(levelname)s\n"
         " - Time:          %(asctime)s\n"
@@ -51,12 +279,67 @@ class TzLogger:
 
     FORMAT_STANDARD = (
         "[%(levelname)s] %(asctime)s\n"
-        "[%(pathname)s] %(funcName)s Line: %(lineno)d\n"
+        "[%(filename)s] %(funcName)s Line: %(lineno)d\n"
         "%(message)s"
     )
 
     FORMAT_SIMPLE = "[%(levelname)s] %(asctime)s:  %(message)s"
 
+    # Shared cache of compiled Formatter instances keyed by format string.
+    # Repeated handler creation with the same format (including the built-in
+    # FORMAT_* constants) reuses the same formatter instead of re-parsing it.
+    _FORMATTER_CACHE: dict = {}
+    _FORMATTER_CACHE_LOCK = threading.Lock()
+
+    # Directories already verified to exist and be writable. Only successful
+    # checks are cached so failures keep raising their precise exception.
+    _DIR_OK_CACHE: dict = {}
+
+    # When True, handler setup toggles the process-wide logging.logThreads /
+    # logProcesses / logMultiprocessing flags and skips the caller-frame walk
+    # based on which fields the active format strings actually reference.
+    # Set to False if other loggers in the process rely on those record fields.
+    TUNE_LOGGING_GLOBALS = True
+
+    # Format-string fragments that require the caller-frame walk.
+    _CALLER_FIELDS = ("%(pathname", "%(filename", "%(funcName", "%(lineno", "%(module")
+
+    # Names for the standard levels, so hot paths skip logging.getLevelName's
+    # dict lookup and fallback formatting.
+    _LEVEL_NAMES = {
+        logging.DEBUG: "DEBUG",
+        logging.INFO: "INFO",
+        logging.WARNING: "WARNING",
+        logging.ERROR: "ERROR",
+        logging.CRITICAL: "CRITICAL",
+    }
+
+    @classmethod
+    def invalidate_dir_cache(cls) -> None:
+        """Clears the cached directory checks (useful in tests or after
+        directories are removed at runtime)."""
+        cls._DIR_OK_CACHE.clear()
+
+    @classmethod
+    def _get_formatter(cls, format_str: str) -> logging.Formatter:
+        """
+        Returns a cached Formatter for the given format string, creating and
+        caching it on first use.
+
+        Args:
+            format_str (str): The %-style format string for the formatter.
+
+        Returns:
+            logging.Formatter: The shared formatter instance for that format.
+        """
+        formatter = cls._FORMATTER_CACHE.get(format_str)
+        if formatter is None:
+            with cls._FORMATTER_CACHE_LOCK:
+                formatter = cls._FORMATTER_CACHE.setdefault(
+                    format_str, _CachingFormatter(format_str)
+                )
+        return formatter
+
     def __init__(self, name: str = "tz_logger"):
         """
         Initializes the logger with a blank (minimal) configuration.
@@ -68,7 +351,68 @@ class TzLogger:
         self.name = name
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.DEBUG)  # Allow all logs to be processed
-        self._original_levels = {}  # Store original levels for restoration
+        # Parallel tuples of handlers and their pre-change levels, captured by
+        # set_temporary_log_level for restoration.
+        self._saved_handlers: tuple = ()
+        self._saved_levels: tuple = ()
+        # Queue plumbing for file handlers, created lazily on first use.
+        self._queue: Optional[queue.Queue] = None
+        self._queue_handler: Optional[QueueHandler] = None
+        self._listener: Optional[QueueListener] = None
+        self._file_handlers: list = []
+        self._bind_level_methods()
+
+    def _bind_level_methods(self) -> None:
+        """
+        Binds debug/info/warning/error/critical convenience methods.
+
+        Levels below the import-time TZ_MAX_LOG_LEVEL threshold are bound to a
+        no-op, so suppressed call sites skip the logging machinery entirely.
+        Note that raising the runtime level cannot re-enable a level stripped
+        at import time.
+        """
+        for method_name, level in (
+            ("debug", logging.DEBUG),
+            ("info", logging.INFO),
+            ("warning", logging.WARNING),
+            ("error", logging.ERROR),
+            ("critical", logging.CRITICAL),
+        ):
+            if level >= TZ_MAX_LOG_LEVEL:
+                setattr(self, method_name, getattr(self.logger, method_name))
+            else:
+                setattr(self, method_name, _noop)
+
+    def log_many(self, level: int, messages: Iterable[str]) -> None:
+        """
+        Logs many pre-formatted messages at a single level.
+
+        Checks the level once and binds the record factory and dispatch to
+        locals, so tight loops pay one attribute-lookup chain for the whole
+        batch instead of a full Logger.log() dispatch per message. Caller
+        info is resolved once for the batch, since every record shares this
+        call site.
+
+        Args:
+            level (int): The log level for every message in the batch.
+            messages (Iterable[str]): The messages to log, already formatted.
+        """
+        logger = self.logger
+        if level < TZ_MAX_LOG_LEVEL or not logger.isEnabledFor(level):
+            return
+
+        try:
+            # stacklevel=2 skips this frame so records report the user's
+            # call site, not log_many itself.
+            fn, lno, func, _ = logger.findCaller(stacklevel=2)
+        except ValueError:  # Interpreter shutdown or missing frames
+            fn, lno, func = "(unknown file)", 0, "(unknown function)"
+
+        make_record = logger.makeRecord
+        handle = logger.handle
+        name = logger.name
+        for message in messages:
+            handle(make_record(name, level, fn, lno, message, None, None, func))
 
     def set_temporary_log_level(self, level: int) -> None:
         """
@@ -77,37 +421,71 @@ class TzLogger:
         Args:
             level (int): The new log level (e.g., logging.DEBUG, logging.INFO, etc.).
         """
-        self._original_levels = {handler: handler.level for handler in self.logger.handlers}
-
-        for handler in self.logger.handlers:
+        # Single pass over the handlers: save each level and apply the new
+        # one. File handlers live behind the queue listener rather than on
+        # the logger, so they are covered explicitly.
+        self._drain_queue()
+        saved_handlers = []
+        saved_levels = []
+        for handler in list(self.logger.handlers) + self._file_handlers:
+            saved_handlers.append(handler)
+            saved_levels.append(handler.level)
             handler.setLevel(level)
+        self._saved_handlers = tuple(saved_handlers)
+        self._saved_levels = tuple(saved_levels)
 
-        print(f"Log level temporarily set to {logging.getLevelName(level)}")
+        # Lazy %-style arguments: the level name is only rendered if a handler
+        # actually emits the record.
+        level_name = self._LEVEL_NAMES.get(level) or logging.getLevelName(level)
+        self.logger.log(level, "Log level temporarily set to %s", level_name)
 
     def restore_log_level(self) -> None:
         """
         Restores the original log level for all handlers after a temporary change.
         """
-        if self._original_levels:
-            for handler, original_level in self._original_levels.items():
+        self._drain_queue()
+        if self._saved_handlers:
+            for handler, original_level in zip(self._saved_handlers, self._saved_levels):
                 handler.setLevel(original_level)
-            print("Log levels restored to their original values.")
+            _internal_logger.debug("Log levels restored to their original values.")
         else:
-            print("No previous log level stored. Nothing to restore.")
+            _internal_logger.debug("No previous log level stored. Nothing to restore.")
+
+        # Clear stored levels after restoration
+        self._saved_handlers = ()
+        self._saved_levels = ()
 
-        self._original_levels.clear()  # Clear stored levels after restoration
+    def _drain_queue(self) -> None:
+        """
+        Blocks until the queue listener has handled every record already
+        enqueued, so handler-level changes never apply retroactively to
+        records still in flight.
+        """
+        if self._queue is not None and self._listener is not None:
+            self._queue.join()
 
     def load_yaml_config(self, config_file: Optional[str] = None) -> None:
         """
-        Loads a YAML configuration file to configure the logger.
+        Loads a YAML (or JSON) configuration file to configure the logger.
+
+        Paths ending in ".json" are parsed with the stdlib json module, which
+        is far faster than PyYAML and avoids importing it at all; every other
+        path is treated as YAML.
 
         Args:
-            config_file (Optional[str]): Path to the YAML configuration file.
+            config_file (Optional[str]): Path to the YAML or JSON configuration file,
+                                         or an open file-like object to read the YAML from.
                                          If None, the environment variable TZ_LOGGING_CONFIG_FILE is used.
 
         Raises:
             FileNotFoundError: If no configuration file is found.
         """
+        if config_file is not None and hasattr(config_file, "read"):
+            # File-like source: parse directly, no disk I/O or caching.
+            config = _yaml().load(config_file, Loader=_YAML_LOADER)
+            self.configure_from_dict(config)
+            return
+
         config_file = config_file or os.getenv("TZ_LOGGING_CONFIG_FILE")
 
         if not config_file or not os.path.exists(config_file):
@@ -116,12 +494,44 @@ class TzLogger:
                 "Set TZ_LOGGING_CONFIG_FILE or pass a file path explicitly."
             )
 
-        with open(config_file, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        stat = os.stat(config_file)
+        # st_mtime_ns avoids float truncation missing sub-second rewrites.
+        cache_key = (config_file, stat.st_mtime_ns, stat.st_size)
+        config = _YAML_CACHE.get(cache_key)
+
+        if config is None:
+            with open(config_file, "r", encoding="utf-8") as f:
+                if config_file.endswith(".json"):
+                    config = json.load(f)
+                else:
+                    config = _yaml().load(f, Loader=_YAML_LOADER)
+            _YAML_CACHE[cache_key] = config
+            while len(_YAML_CACHE) > _YAML_CACHE_MAX:
+                del _YAML_CACHE[next(iter(_YAML_CACHE))]
+
+        # dictConfig mutates the dict it is given, so hand it a copy to keep
+        # the cached parse reusable.
+        self.configure_from_dict(copy.deepcopy(config))
+
+    def configure_from_dict(self, config: dict) -> None:
+        """
+        Configures the logger directly from a dictConfig-style dictionary.
+
+        Skips file I/O and YAML parsing entirely for callers that already hold
+        the configuration as a Python dict (tests, services building config
+        programmatically). Note that dictConfig mutates the dict it receives.
 
+        Args:
+            config (dict): A logging.config.dictConfig compatible dictionary.
+        """
         logging.config.dictConfig(config)
         self.logger = logging.getLogger(self.name)
         self.logger.setLevel(logging.getLogger().level)  # Sync with root logger
+        self._bind_level_methods()  # Rebind convenience methods to the new logger
+        # dictConfig replaced the handler set, so any earlier tuning (the
+        # findCaller stub, cleared thread/process flags) is stale; re-derive
+        # it from the formats that are now active.
+        self._tune_logging_globals()
 
     def add_stream_handler(self, config: StreamHandlerConfig) -> logging.Handler:
         """
@@ -141,37 +551,200 @@ class TzLogger:
 
         handler = logging.StreamHandler(config.stream)
         handler.setLevel(config.level)
-        formatter = logging.Formatter(config.format_str or self.FORMAT_SIMPLE)
+        formatter = self._get_formatter(config.format_str or self.FORMAT_SIMPLE)
         handler.setFormatter(formatter)
         self.logger.addHandler(handler)
+        _enable_fast_handle(handler)
+        self._tune_logging_globals()
         return handler
 
-    def add_rotating_file_handler(self, config: RotatingFileHandlerConfig) -> None:
+    def add_rotating_file_handler(self, config: RotatingFileHandlerConfig) -> logging.Handler:
         """
         Adds a rotating file handler to the logger using the provided configuration.
 
+        The handler runs inside a background QueueListener; records reach it
+        through a single QueueHandler on the logger, so callers never block on
+        file writes or rollovers. Call shutdown() to drain and close.
+
         Args:
             config (RotatingFileHandlerConfig): Configuration object for the file handler.
 
+        Returns:
+            logging.Handler: The created rotating file handler, so callers can
+                             attach filters or tweak it without re-fetching it.
+
         Raises:
             FileNotFoundError: If the log directory does not exist.
             PermissionError: If the log directory is not writable.
         """
+        handler = self._build_rotating_file_handler(config)
+        self._file_handlers.append(handler)
+        self._start_listener()
+        self._tune_logging_globals()
+        return handler
+
+    def _build_rotating_file_handler(
+        self, config: RotatingFileHandlerConfig
+    ) -> BufferedRotatingFileHandler:
+        """
+        Validates the log directory and builds a configured rotating file
+        handler without attaching it to the queue listener.
+        """
         log_dir = os.path.dirname(config.file_path)
 
-        if not os.path.exists(log_dir):
-            raise FileNotFoundError(f"Log directory does not exist: {log_dir}")
+        if not TzLogger._DIR_OK_CACHE.get(log_dir):
+            if not os.path.exists(log_dir):
+                raise FileNotFoundError(f"Log directory does not exist: {log_dir}")
+
+            if not os.access(log_dir, os.W_OK):
+                raise PermissionError(f"Cannot write to log directory: {log_dir}")
 
-        if not os.access(log_dir, os.W_OK):
-            raise PermissionError(f"Cannot write to log directory: {log_dir}")
+            TzLogger._DIR_OK_CACHE[log_dir] = True
 
-        handler = RotatingFileHandler(
+        handler = BufferedRotatingFileHandler(
             config.file_path, maxBytes=config.max_bytes, backupCount=config.backup_count
         )
         handler.setLevel(config.level)
-        formatter = logging.Formatter(config.format_str or self.FORMAT_STANDARD)
+        formatter = self._get_formatter(config.format_str or self.FORMAT_STANDARD)
         handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        _enable_fast_handle(handler)
+        return handler
+
+    def _start_listener(self) -> None:
+        """
+        (Re)starts the queue listener that services the file handlers.
+
+        The logger only ever carries a single QueueHandler; file writes and
+        rollovers happen on the listener's background thread, so producer
+        threads pay just a queue put per record.
+        """
+        if self._queue is None:
+            self._queue = queue.Queue(-1)
+            self._queue_handler = QueueHandler(self._queue)
+            self.logger.addHandler(self._queue_handler)
+            _enable_fast_handle(self._queue_handler)
+            atexit.register(self.shutdown)
+
+        if self._listener is not None:
+            self._listener.stop()
+
+        self._listener = QueueListener(
+            self._queue, *self._file_handlers, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def __enter__(self) -> "TzLogger":
+        """Supports use as a context manager for deterministic cleanup."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Drains and closes the file handlers on context exit, so callers
+        (and tests) never rely on garbage collection to release log files."""
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """
+        Stops the queue listener, draining any pending records, and closes the
+        file handlers. Safe to call more than once; registered via atexit so
+        queued records are flushed at interpreter exit.
+        """
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+        if self._queue_handler is not None:
+            self.logger.removeHandler(self._queue_handler)
+            self._queue_handler = None
+            self._queue = None
+
+        for handler in self._file_handlers:
+            handler.close()
+        self._file_handlers.clear()
+
+    def _tune_logging_globals(self) -> None:
+        """
+        Enables only the per-record metadata the active formats reference.
+
+        Scans the format strings of all attached handlers (stream and queued
+        file handlers alike) and toggles the process-wide thread/process flags
+        plus the caller-frame walk accordingly. No-op when
+        TUNE_LOGGING_GLOBALS is False.
+        """
+        if not self.TUNE_LOGGING_GLOBALS:
+            return
+
+        formats = []
+        for handler in list(self.logger.handlers) + self._file_handlers:
+            fmt = getattr(handler.formatter, "_fmt", None)
+            if fmt:
+                formats.append(fmt)
+        needs = "".join(formats)
+
+        # When records propagate to ancestor handlers, their formats are not
+        # visible here, so every optional field must be kept populated.
+        propagates = self._propagates_to_other_handlers()
+
+        logging.logThreads = propagates or "%(thread" in needs
+        logging.logProcesses = propagates or "%(process)" in needs
+        logging.logMultiprocessing = propagates or "%(processName" in needs
+
+        if propagates or any(field in needs for field in self._CALLER_FIELDS):
+            self.logger.__dict__.pop("findCaller", None)  # Restore the real walk
+        else:
+            self.logger.findCaller = _unknown_caller
+
+    def _propagates_to_other_handlers(self) -> bool:
+        """
+        Returns True when records from this logger propagate to an ancestor
+        that has handlers of its own. Those handlers' formats are not visible
+        here, so caller info must be kept in case any of them reference it.
+        """
+        logger = self.logger
+        while logger.propagate and logger.parent is not None:
+            logger = logger.parent
+            if logger.handlers:
+                return True
+        return False
+
+    def add_handlers(
+        self, configs: Iterable[Union[StreamHandlerConfig, RotatingFileHandlerConfig]]
+    ) -> list:
+        """
+        Adds several handlers in one call, dispatching on the config type.
+
+        Amortizes the per-call setup when an application wires up multiple
+        handlers at startup, and restarts the file-handler queue listener at
+        most once instead of once per rotating handler.
+
+        Args:
+            configs (Iterable): StreamHandlerConfig and/or
+                                RotatingFileHandlerConfig instances.
+
+        Returns:
+            list: The created handler instances, stream handlers first and
+                  then file handlers.
+
+        Raises:
+            TypeError: If a config is not a recognized handler config type.
+        """
+        handlers = []
+        file_configs = []
+        for config in configs:
+            if isinstance(config, StreamHandlerConfig):
+                handlers.append(self.add_stream_handler(config))
+            elif isinstance(config, RotatingFileHandlerConfig):
+                file_configs.append(config)
+            else:
+                raise TypeError(f"Unsupported handler config: {config!r}")
+
+        if file_configs:
+            built = [self._build_rotating_file_handler(c) for c in file_configs]
+            self._file_handlers.extend(built)
+            self._start_listener()  # One restart covers all new file handlers
+            self._tune_logging_globals()
+            handlers.extend(built)
+
+        return handlers
 
     def add_filter(self, log_filter: logging.Filter) -> None:
         """
@@ -192,5 +765,37 @@ class TzLogger:
             positive (bool): If True, only logs containing the keyword will be shown.
                              If False, logs containing the keyword will be hidden.
         """
-        keyword_filter = KeywordFilter(keyword, positive)
-        self.add_filter(keyword_filter)
\ No newline at end of file
+        if positive:
+            # Positive filters stack with AND semantics (every keyword must
+            # appear), so they cannot be folded into one alternation.
+            self.add_filter(KeywordFilter(keyword, True))
+            return
+
+        # Negative filters compose as "hide if any keyword matches", which is
+        # exactly one alternation regex — coalesce per handler.
+        for handler in self.logger.handlers:
+            for i, existing in enumerate(handler.filters):
+                if isinstance(existing, CoalescedKeywordFilter) and not existing.positive:
+                    handler.filters[i] = CoalescedKeywordFilter(
+                        existing.keywords + (keyword,), positive=False
+                    )
+                    break
+                if isinstance(existing, KeywordFilter) and not existing.positive:
+                    handler.filters[i] = CoalescedKeywordFilter(
+                        (existing.keyword, keyword), positive=False
+                    )
+                    break
+            else:
+                handler.addFilter(KeywordFilter(keyword, False))
+
+
+# Pre-populate the formatter cache with the built-in formats so the first
+# handler created with any of them skips format-string parsing entirely.
+for _fmt in (
+    TzLogger.FORMAT_DETAILED,
+    TzLogger.FORMAT_DETAILED_FULLPATH,
+    TzLogger.FORMAT_STANDARD,
+    TzLogger.FORMAT_SIMPLE,
+):
+    TzLogger._FORMATTER_CACHE[_fmt] = _CachingFormatter(_fmt)
+del _fmt
\ No newline at end of file
@@ -1,3 +1,4 @@
+import io
 import os
 import sys
 import pytest
@@ -6,23 +7,68 @@ import yaml
 from tz_logging.core import TzLogger, StreamHandlerConfig, RotatingFileHandlerConfig
 
 
+# Shared YAML fixture content, built once at import instead of inline in each
+# test; only the level differs between the tests that use it.
+_YAML_CONSOLE_CONFIG = """
+version: 1
+disable_existing_loggers: False
+formatters:
+  simple:
+    format: "[%(levelname)s] %(message)s"
+handlers:
+  console:
+    class: logging.StreamHandler
+    level: {level}
+    formatter: simple
+    stream: ext://sys.stdout
+root:
+  level: {level}
+  handlers: [console]
+"""
+
+
 class DummyFilter(logging.Filter):
     """A simple dummy filter for testing logging filters."""
     def filter(self, record: logging.LogRecord) -> bool:
         return True
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def logger_instance() -> TzLogger:
     """
-    Fixture to create a fresh TzLogger instance with no handlers.
-    
+    Fixture providing a shared TzLogger instance for the module.
+
     Returns:
-        TzLogger: A new instance of TzLogger with the name 'test_logger'.
+        TzLogger: A single TzLogger named 'test_logger', reset between tests
+        by the autouse _pristine_logger fixture.
     """
     return TzLogger("test_logger")
 
 
+@pytest.fixture(autouse=True)
+def _pristine_logger(logger_instance: TzLogger):
+    """
+    Resets the shared logger before each test.
+
+    Stops any queue listener, clears handlers/filters on the underlying
+    logger, and drops saved levels so every test starts from a clean slate
+    without paying for a full TzLogger reconstruction.
+    """
+    logger_instance.shutdown()
+    logger_instance.logger.handlers.clear()
+    logger_instance.logger.filters.clear()
+    logger_instance.logger.setLevel(logging.DEBUG)  # Undo levels left by dictConfig tests
+    logger_instance.logger.propagate = True
+    logger_instance._saved_handlers = ()
+    logger_instance._saved_levels = ()
+    yield
+    # Handler setup tunes these process-wide; restore the stdlib defaults so
+    # no test leaks a disabled flag into the rest of the suite.
+    logging.logThreads = True
+    logging.logProcesses = True
+    logging.logMultiprocessing = True
+
+
 def test_logger_initialization(logger_instance: TzLogger) -> None:
     """
     Test that the logger initializes with correct default values.
@@ -34,28 +80,31 @@ def test_logger_initialization(logger_instance: TzLogger) -> None:
     assert logger_instance.logger.handlers == []  # Should start with no handlers
 
 
-def test_add_stream_handler(logger_instance: TzLogger, capsys) -> None:
+def test_add_stream_handler(logger_instance: TzLogger) -> None:
     """
     Test adding a stream handler and logging an INFO message.
-    
-    Ensures that after adding a stream handler, messages logged at INFO level appear in the console.
+
+    Uses an in-memory StringIO sink instead of stdout, so the assertion reads
+    the handler's output directly without pytest's capture machinery.
     """
-    console_config = StreamHandlerConfig(stream=sys.stdout, level=logging.INFO)
+    sink = io.StringIO()
+    console_config = StreamHandlerConfig(stream=sink, level=logging.INFO)
     logger_instance.add_stream_handler(console_config)
 
     assert len(logger_instance.logger.handlers) == 1
     assert isinstance(logger_instance.logger.handlers[0], logging.StreamHandler)
 
     logger_instance.logger.info("Test INFO message")
-    captured = capsys.readouterr()
-    assert "Test INFO message" in captured.out  # Verify log appears in console
+    assert "Test INFO message" in sink.getvalue()  # Verify log reached the sink
 
 
 def test_add_rotating_file_handler(logger_instance: TzLogger, tmp_path) -> None:
     """
     Test adding a rotating file handler and logging a message.
-    
-    Verifies that a RotatingFileHandler is correctly added and that logged messages are written to the file.
+
+    Verifies that the logger carries a single QueueHandler, that the
+    RotatingFileHandler runs inside the queue listener, and that logged
+    messages are written to the file once the queue is drained.
     """
     # Ensure the logger is clean before testing
     logger_instance.logger.handlers.clear()
@@ -70,16 +119,46 @@ def test_add_rotating_file_handler(logger_instance: TzLogger, tmp_path) -> None:
     logger_instance.add_rotating_file_handler(file_config)
 
     assert len(logger_instance.logger.handlers) == 1
-    assert isinstance(logger_instance.logger.handlers[0], logging.handlers.RotatingFileHandler)
+    assert isinstance(logger_instance.logger.handlers[0], logging.handlers.QueueHandler)
+    assert isinstance(logger_instance._file_handlers[0], logging.handlers.RotatingFileHandler)
 
     logger_instance.logger.debug("Test DEBUG message")
+    logger_instance.shutdown()  # Drain the queue and close the file handler
 
     with open(log_file, "r") as f:
         content = f.read()
-    
+
     assert "Test DEBUG message" in content  # Verify log was written to file
 
 
+def test_rotating_file_handler_rolls_over(logger_instance: TzLogger, tmp_path) -> None:
+    """
+    Test that the buffered rotating file handler still rolls over by size.
+
+    Logs enough records to exceed max_bytes and verifies a backup file is
+    created, covering the stat-free shouldRollover override. The messages
+    include multibyte characters so the byte-based size accounting is
+    exercised, not just character counts.
+    """
+    log_file = tmp_path / "rolling.log"
+    file_config = RotatingFileHandlerConfig(
+        file_path=str(log_file),
+        max_bytes=512,
+        backup_count=2,
+        level=logging.DEBUG,
+    )
+    logger_instance.add_rotating_file_handler(file_config)
+
+    for i in range(50):
+        logger_instance.logger.info("Rollover füller méssage %d", i)
+    logger_instance.shutdown()  # Drain the queue and flush the buffers
+
+    assert log_file.exists()
+    assert (tmp_path / "rolling.log.1").exists()  # At least one rollover happened
+    # Rolled files must respect the byte limit despite multibyte content.
+    assert os.path.getsize(tmp_path / "rolling.log.1") <= 512
+
+
 def test_load_yaml_config(logger_instance: TzLogger, tmp_path) -> None:
     """
     Test loading a YAML configuration file.
@@ -88,64 +167,164 @@ def test_load_yaml_config(logger_instance: TzLogger, tmp_path) -> None:
     levels are updated as specified in the configuration.
     """
     yaml_file = tmp_path / "logging.yaml"
-    yaml_content = """
-version: 1
-disable_existing_loggers: False
-formatters:
-  simple:
-    format: "[%(levelname)s] %(message)s"
-handlers:
-  console:
-    class: logging.StreamHandler
-    level: INFO
-    formatter: simple
-    stream: ext://sys.stdout
-root:
-  level: INFO
-  handlers: [console]
-"""
-    yaml_file.write_text(yaml_content)
+    yaml_file.write_text(_YAML_CONSOLE_CONFIG.format(level="INFO"))
     logger_instance.load_yaml_config(str(yaml_file))
 
     assert logger_instance.logger.level == logging.INFO
-    assert logging.getLogger().level == logging.INFO  # Verify root logger level
-    assert len(logger_instance.logger.handlers) == 1
-    assert isinstance(logger_instance.logger.handlers[0], logging.StreamHandler)
+    root_logger = logging.getLogger()
+    assert root_logger.level == logging.INFO  # Verify root logger level
+    assert len(root_logger.handlers) == 1  # Console handler from the YAML config
+    assert isinstance(root_logger.handlers[0], logging.StreamHandler)
+
+
+def test_load_yaml_config_caches_parse(logger_instance: TzLogger, tmp_path, monkeypatch) -> None:
+    """
+    Test that repeated loads of an unchanged YAML file skip re-parsing.
+
+    Loads the same file twice and verifies the second load is served from the
+    cache by making yaml.load fail after the first parse.
+    """
+    yaml_file = tmp_path / "cached_logging.yaml"
+    yaml_file.write_text(
+        "version: 1\n"
+        "disable_existing_loggers: False\n"
+        "root:\n"
+        "  level: INFO\n"
+    )
+    logger_instance.load_yaml_config(str(yaml_file))
+
+    def fail_load(*args, **kwargs):
+        raise AssertionError("yaml.load should not run for an unchanged file")
+
+    monkeypatch.setattr(yaml, "load", fail_load)
+    logger_instance.load_yaml_config(str(yaml_file))  # Served from the cache
+
+    assert logging.getLogger().level == logging.INFO
+
+
+def test_load_json_config(logger_instance: TzLogger, tmp_path) -> None:
+    """
+    Test loading a JSON configuration file.
+
+    Paths ending in .json are parsed with the stdlib json module instead of
+    PyYAML; verifies the root logger picks up the configured level.
+    """
+    import json
+
+    json_file = tmp_path / "logging.json"
+    json_file.write_text(json.dumps({
+        "version": 1,
+        "disable_existing_loggers": False,
+        "root": {"level": "ERROR"},
+    }))
+    logger_instance.load_yaml_config(str(json_file))
+
+    assert logging.getLogger().level == logging.ERROR
+
+
+def test_configure_from_dict(logger_instance: TzLogger) -> None:
+    """
+    Test configuring the logger from a dict without any YAML involved.
+
+    Applies a dictConfig-style dictionary and verifies the root and instance
+    logger levels reflect it, and that stale format tuning from handlers the
+    config replaced does not survive reconfiguration.
+    """
+    # Install the caller-info stub via a FORMAT_SIMPLE handler first, so the
+    # reconfiguration below has stale tuning to undo.
+    logger_instance.logger.propagate = False
+    logger_instance.add_stream_handler(StreamHandlerConfig(stream=sys.stdout, level=logging.INFO))
+    assert "findCaller" in logger_instance.logger.__dict__
+
+    logger_instance.configure_from_dict({
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {"located": {"format": "%(filename)s:%(lineno)d %(message)s"}},
+        "handlers": {
+            "console": {
+                "class": "logging.StreamHandler",
+                "formatter": "located",
+                "stream": "ext://sys.stdout",
+            },
+        },
+        "loggers": {
+            "test_logger": {"handlers": ["console"], "propagate": False},
+        },
+        "root": {"level": "WARNING"},
+    })
+
+    assert logging.getLogger().level == logging.WARNING
+    assert logger_instance.logger.level == logging.WARNING
+    # The new format references caller fields, so the stub must be gone,
+    # while the thread flag is re-derived from the new format.
+    assert "findCaller" not in logger_instance.logger.__dict__
+    assert logging.logThreads is False
 
 
-def test_set_temporary_log_level_and_restore(logger_instance: TzLogger) -> None:
+def test_log_many(logger_instance: TzLogger) -> None:
+    """
+    Test logging a batch of messages with log_many.
+
+    All messages at an enabled level reach the handler, and a batch below the
+    logger's effective level is skipped entirely.
+    """
+    sink = io.StringIO()
+    logger_instance.add_stream_handler(StreamHandlerConfig(stream=sink, level=logging.DEBUG))
+
+    logger_instance.log_many(logging.INFO, [f"Batch message {i}" for i in range(5)])
+    output = sink.getvalue()
+    for i in range(5):
+        assert f"Batch message {i}" in output
+
+    logger_instance.logger.setLevel(logging.WARNING)
+    logger_instance.log_many(logging.INFO, ["Suppressed batch message"])
+    logger_instance.logger.setLevel(logging.DEBUG)
+    assert "Suppressed batch message" not in sink.getvalue()
+
+
+def test_set_temporary_log_level_and_restore(logger_instance: TzLogger, tmp_path) -> None:
     """
     Test temporarily changing the log level and restoring it.
-    
-    Adds a stream handler, changes its log level to DEBUG temporarily, and then restores it.
+
+    Adds a stream handler and a rotating file handler at INFO, changes both
+    levels to DEBUG temporarily, and then restores them to the original
+    level. The file handler lives behind the queue listener, so this also
+    covers handlers that are not attached to the logger directly.
     """
-    console_config = StreamHandlerConfig(stream=sys.stdout, level=logging.INFO)
-    logger_instance.add_stream_handler(console_config)
+    stream_config = StreamHandlerConfig(stream=sys.stdout, level=logging.INFO)
+    handler = logger_instance.add_stream_handler(stream_config)
+    file_handler = logger_instance.add_rotating_file_handler(
+        RotatingFileHandlerConfig(file_path=str(tmp_path / "temp_level.log"), level=logging.INFO)
+    )
 
-    original_level = logger_instance.logger.handlers[0].level
+    original_level = handler.level
+    assert original_level == logging.INFO, "Initial handler level should be INFO"
+    assert file_handler.level == logging.INFO, "Initial file handler level should be INFO"
 
     logger_instance.set_temporary_log_level(logging.DEBUG)
-    assert logger_instance.logger.handlers[0].level == logging.DEBUG
+    assert handler.level == logging.DEBUG, "Handler level should be DEBUG after temporary change"
+    assert file_handler.level == logging.DEBUG, "File handler level should be DEBUG after temporary change"
 
     logger_instance.restore_log_level()
-    assert logger_instance.logger.handlers[0].level == original_level
+    assert handler.level == original_level, "Handler level should be restored to INFO after calling restore_log_level()"
+    assert file_handler.level == original_level, "File handler level should be restored to INFO"
 
 
-def test_restore_log_level_no_previous_changes(capfd) -> None:
+def test_restore_log_level_no_previous_changes(caplog) -> None:
     """
     Test calling restore_log_level when no temporary changes were made.
-    
-    Verifies that calling restore_log_level without prior changes prints the expected message
-    and leaves the _original_levels dictionary empty.
+
+    Verifies that calling restore_log_level without prior changes logs the expected message
+    on the internal logger and leaves the saved handler/level tuples empty.
     """
     logger = TzLogger("test_logger")
-    # Ensure _original_levels is empty
-    assert not logger._original_levels, "Expected _original_levels to be empty before calling restore_log_level"
+    # Ensure no levels are saved
+    assert not logger._saved_handlers, "Expected _saved_handlers to be empty before calling restore_log_level"
 
-    logger.restore_log_level()
-    captured = capfd.readouterr()
-    assert "No previous log level stored. Nothing to restore." in captured.out, f"Unexpected output: {captured.out}"
-    assert not logger._original_levels, "Expected _original_levels to remain empty after restore_log_level"
+    with caplog.at_level(logging.DEBUG, logger="tz_logging.internal"):
+        logger.restore_log_level()
+    assert "No previous log level stored. Nothing to restore." in caplog.text, f"Unexpected output: {caplog.text}"
+    assert not logger._saved_handlers, "Expected _saved_handlers to remain empty after restore_log_level"
 
 
 def test_environment_variable_yaml_loading(monkeypatch, tmp_path) -> None:
@@ -155,24 +334,9 @@ def test_environment_variable_yaml_loading(monkeypatch, tmp_path) -> None:
     Sets the TZ_LOGGING_CONFIG_FILE environment variable and verifies that the logger is configured accordingly.
     """
     yaml_file = tmp_path / "env_logging.yaml"
-    yaml_content = """
-version: 1
-disable_existing_loggers: False
-formatters:
-  simple:
-    format: "[%(levelname)s] %(message)s"
-handlers:
-  console:
-    class: logging.StreamHandler
-    level: WARNING
-    formatter: simple
-    stream: ext://sys.stdout
-root:
-  level: WARNING
-  handlers: [console]
-"""
-    yaml_file.write_text(yaml_content)
-    
+    yaml_file.write_text(_YAML_CONSOLE_CONFIG.format(level="WARNING"))
+
+
     monkeypatch.setenv("TZ_LOGGING_CONFIG_FILE", str(yaml_file))
     logger_instance_env = TzLogger("env_test_logger")
     logger_instance_env.load_yaml_config()
@@ -180,17 +344,26 @@ root:
     assert logger_instance_env.logger.level == logging.WARNING  # Ensures environment variable works
 
 
-def test_load_yaml_config_invalid_yaml(logger_instance: TzLogger, tmp_path) -> None:
+def test_load_yaml_config_invalid_yaml(logger_instance: TzLogger) -> None:
     """
-    Test that loading an invalid YAML configuration file raises a yaml.YAMLError.
-    
-    Writes an invalid YAML file and confirms that a yaml.YAMLError is raised.
+    Test that loading invalid YAML raises a yaml.YAMLError.
+
+    Feeds invalid YAML through an in-memory stream and confirms that a
+    yaml.YAMLError is raised, with no disk round-trip needed.
     """
-    invalid_yaml_file = tmp_path / "invalid.yaml"
-    invalid_yaml_file.write_text("this: is: not: valid: yaml: :::")
-    
     with pytest.raises(yaml.YAMLError):
-        logger_instance.load_yaml_config(str(invalid_yaml_file))
+        logger_instance.load_yaml_config(io.StringIO("this: is: not: valid: yaml: :::"))
+
+
+def test_load_yaml_config_from_file_like(logger_instance: TzLogger) -> None:
+    """
+    Test loading a YAML configuration from an open file-like object.
+
+    Passes an io.StringIO holding the shared config and verifies the root
+    logger picks up the configured level.
+    """
+    logger_instance.load_yaml_config(io.StringIO(_YAML_CONSOLE_CONFIG.format(level="INFO")))
+    assert logging.getLogger().level == logging.INFO
 
 
 def test_load_nonexistent_yaml() -> None:
@@ -204,25 +377,6 @@ def test_load_nonexistent_yaml() -> None:
         logger.load_yaml_config("does_not_exist.yaml")
 
 
-def test_set_and_restore_temporary_log_level(logger_instance: TzLogger) -> None:
-    """
-    Test that set_temporary_log_level and restore_log_level work as expected.
-    
-    Attaches a stream handler with level INFO, changes it to DEBUG, and then restores it.
-    """
-    stream_config = StreamHandlerConfig(stream=sys.stdout, level=logging.INFO)
-    handler = logger_instance.add_stream_handler(stream_config)
-    
-    original_level = handler.level
-    assert original_level == logging.INFO, "Initial handler level should be INFO"
-    
-    logger_instance.set_temporary_log_level(logging.DEBUG)
-    assert handler.level == logging.DEBUG, "Handler level should be DEBUG after temporary change"
-    
-    logger_instance.restore_log_level()
-    assert handler.level == original_level, "Handler level should be restored to INFO after calling restore_log_level()"
-
-
 def test_invalid_log_file_path(tmp_path) -> None:
     """
     Test setting an invalid file path for logging.
@@ -273,6 +427,64 @@ def test_unwritable_log_directory(monkeypatch, tmp_path) -> None:
         logger.add_rotating_file_handler(config)
 
 
+def test_add_handlers_bulk(logger_instance: TzLogger, tmp_path) -> None:
+    """
+    Test adding several handlers in one add_handlers call.
+
+    Mixes stream and rotating-file configs and verifies the created handlers
+    are returned and wired up (stream handlers on the logger, file handlers
+    behind the queue listener). Also checks unknown config types raise.
+    """
+    stream_config = StreamHandlerConfig(stream=sys.stdout, level=logging.INFO)
+    file_config = RotatingFileHandlerConfig(file_path=str(tmp_path / "bulk.log"))
+
+    handlers = logger_instance.add_handlers([stream_config, file_config])
+
+    assert len(handlers) == 2
+    assert isinstance(handlers[0], logging.StreamHandler)
+    assert isinstance(handlers[1], logging.handlers.RotatingFileHandler)
+    assert handlers[1] in logger_instance._file_handlers
+
+    with pytest.raises(TypeError, match="Unsupported handler config"):
+        logger_instance.add_handlers([object()])
+
+    logger_instance.shutdown()
+
+
+def test_dir_check_cache(logger_instance: TzLogger, tmp_path) -> None:
+    """
+    Test that the directory existence/writability check is cached.
+
+    Adds a rotating file handler and verifies the directory lands in the cache,
+    and that invalidate_dir_cache() clears it again.
+    """
+    log_file = tmp_path / "cached.log"
+    logger_instance.add_rotating_file_handler(RotatingFileHandlerConfig(file_path=str(log_file)))
+
+    assert TzLogger._DIR_OK_CACHE.get(str(tmp_path)) is True
+
+    TzLogger.invalidate_dir_cache()
+    assert not TzLogger._DIR_OK_CACHE
+    logger_instance.shutdown()
+
+
+def test_context_manager_shuts_down(tmp_path) -> None:
+    """
+    Test that using TzLogger as a context manager drains and closes handlers.
+
+    On exit the queue listener is stopped, the file handler closed, and the
+    logged message is on disk — no GC or sleeps needed to release the file.
+    """
+    log_file = tmp_path / "ctx.log"
+    with TzLogger("ctx_logger") as logger:
+        logger.add_rotating_file_handler(RotatingFileHandlerConfig(file_path=str(log_file)))
+        logger.logger.info("Context-managed message")
+
+    assert logger._listener is None
+    assert logger._file_handlers == []
+    assert "Context-managed message" in log_file.read_text()
+
+
 def test_add_filter(logger_instance: TzLogger) -> None:
     """
     Test that add_filter correctly attaches the given filter to all handlers.
@@ -304,6 +516,129 @@ def test_stream_handler_config_repr() -> None:
     assert "format_str=%(message)s" in actual_repr, f"Expected format_str in __repr__, got: {actual_repr}"
 
 
+def test_level_methods_bound_by_default(logger_instance: TzLogger, capsys) -> None:
+    """
+    Test that the convenience level methods delegate to the underlying logger.
+
+    With no TZ_MAX_LOG_LEVEL set, debug/info/etc. are bound to the real logger methods.
+    """
+    logger_instance.add_stream_handler(StreamHandlerConfig(stream=sys.stdout, level=logging.DEBUG))
+    logger_instance.debug("Bound DEBUG message")
+    captured = capsys.readouterr()
+    assert "Bound DEBUG message" in captured.out
+
+
+def test_level_methods_stripped_by_max_level(monkeypatch, capsys) -> None:
+    """
+    Test that levels below TZ_MAX_LOG_LEVEL are rebound to a no-op.
+
+    Patches the import-time threshold to INFO and verifies debug becomes a no-op
+    while info still logs.
+    """
+    from tz_logging import core
+    monkeypatch.setattr(core, "TZ_MAX_LOG_LEVEL", logging.INFO)
+
+    logger = TzLogger("stripped_logger")
+    logger.add_stream_handler(StreamHandlerConfig(stream=sys.stdout, level=logging.DEBUG))
+
+    logger.debug("Stripped DEBUG message")
+    logger.info("Kept INFO message")
+    captured = capsys.readouterr()
+    assert "Stripped DEBUG message" not in captured.out
+    assert "Kept INFO message" in captured.out
+
+
+def test_fast_handle_for_filterless_handlers(logger_instance: TzLogger, capsys) -> None:
+    """
+    Test the fast-path handle() installed on handlers without filters.
+
+    A freshly added handler carries the fast handle; adding a filter restores
+    the stock filtering path and the filter takes effect.
+    """
+    handler = logger_instance.add_stream_handler(
+        StreamHandlerConfig(stream=sys.stdout, level=logging.DEBUG)
+    )
+    assert "handle" in handler.__dict__, "Filterless handler should use the fast handle"
+
+    logger_instance.logger.info("Fast path message")
+    captured = capsys.readouterr()
+    assert "Fast path message" in captured.out
+
+    handler.addFilter(DummyFilter("dummy"))
+    assert "handle" not in handler.__dict__, "Adding a filter should restore the stock handle"
+
+    logger_instance.logger.info("Filtered path message")
+    captured = capsys.readouterr()
+    assert "Filtered path message" in captured.out
+
+
+def test_tune_logging_globals(logger_instance: TzLogger) -> None:
+    """
+    Test that handler setup tunes the frame/thread/process logging globals.
+
+    With only FORMAT_SIMPLE attached the caller-frame walk is skipped; adding a
+    FORMAT_DETAILED handler restores it. Thread/process flags follow the
+    fields the formats reference. The walk is only ever skipped when records
+    cannot propagate to ancestor handlers whose formats we cannot see (pytest
+    itself keeps a capture handler on the root logger).
+    """
+    logger_instance.add_stream_handler(StreamHandlerConfig(stream=sys.stdout, level=logging.INFO))
+    assert "findCaller" not in logger_instance.logger.__dict__  # Propagates to root capture handler
+    assert logging.logThreads is True  # Ancestor formats are invisible, so flags stay on
+
+    logger_instance.logger.propagate = False
+    logger_instance.add_stream_handler(StreamHandlerConfig(stream=sys.stdout, level=logging.INFO))
+    assert "findCaller" in logger_instance.logger.__dict__  # Frame walk skipped
+    assert logging.logThreads is False
+
+    detailed = StreamHandlerConfig(
+        stream=sys.stdout, level=logging.INFO, format_str=TzLogger.FORMAT_DETAILED
+    )
+    logger_instance.add_stream_handler(detailed)
+    assert "findCaller" not in logger_instance.logger.__dict__  # Frame walk restored
+
+
+def test_formatter_cache_reuse(logger_instance: TzLogger) -> None:
+    """
+    Test that handlers created with the same format string share one Formatter.
+
+    Adds two stream handlers with the default format and verifies both reuse the
+    cached Formatter instance, including the pre-populated built-in formats.
+    """
+    first = logger_instance.add_stream_handler(StreamHandlerConfig(stream=sys.stdout))
+    second = logger_instance.add_stream_handler(StreamHandlerConfig(stream=sys.stdout))
+
+    assert first.formatter is second.formatter, "Handlers with the same format should share a Formatter"
+    assert TzLogger.FORMAT_SIMPLE in TzLogger._FORMATTER_CACHE
+    assert TzLogger.FORMAT_STANDARD in TzLogger._FORMATTER_CACHE
+    assert TzLogger.FORMAT_DETAILED in TzLogger._FORMATTER_CACHE
+
+
+def test_shared_formatter_formats_record_once(monkeypatch) -> None:
+    """
+    Test that a cached formatter formats each record only once.
+
+    Two handlers sharing a formatter re-use the output cached on the record,
+    so the underlying formatMessage runs a single time per record.
+    """
+    calls = []
+    original = logging.Formatter.formatMessage
+
+    def counting_format_message(self, record):
+        calls.append(record)
+        return original(self, record)
+
+    monkeypatch.setattr(logging.Formatter, "formatMessage", counting_format_message)
+
+    formatter = TzLogger._get_formatter(TzLogger.FORMAT_SIMPLE)
+    record = logging.LogRecord("fmt_once", logging.INFO, __file__, 1, "one pass", None, None)
+    first = formatter.format(record)
+    second = formatter.format(record)  # Served from the record cache
+
+    assert first == second
+    assert len(calls) == 1
+
+
 def test_positive_keyword_filter(logger_instance, capsys):
     """Test positive filtering (only logs containing the keyword are shown)."""
     logger_instance.add_stream_handler(StreamHandlerConfig(stream=sys.stdout, level=logging.DEBUG))
@@ -317,6 +652,30 @@ def test_positive_keyword_filter(logger_instance, capsys):
     assert "This is an INFO log." not in captured.out
 
 
+def test_negative_keyword_filters_coalesce(logger_instance, capsys):
+    """Test that stacked negative keyword filters merge into one alternation filter."""
+    from tz_logging.core import CoalescedKeywordFilter
+
+    handler = logger_instance.add_stream_handler(
+        StreamHandlerConfig(stream=sys.stdout, level=logging.DEBUG)
+    )
+    logger_instance.add_keyword_filter("alpha", positive=False)
+    logger_instance.add_keyword_filter("beta", positive=False)
+
+    coalesced = [f for f in handler.filters if isinstance(f, CoalescedKeywordFilter)]
+    assert len(coalesced) == 1, "Expected the two negative filters to merge into one"
+    assert coalesced[0].keywords == ("alpha", "beta")
+
+    logger_instance.logger.info("message with alpha inside")  # Hidden
+    logger_instance.logger.info("message with beta inside")  # Hidden
+    logger_instance.logger.info("plain message")  # Shown
+
+    captured = capsys.readouterr()
+    assert "alpha" not in captured.out
+    assert "beta" not in captured.out
+    assert "plain message" in captured.out
+
+
 def test_negative_keyword_filter(logger_instance, capsys):
     """Test negative filtering (logs containing the keyword are hidden)."""
     logger_instance.add_stream_handler(StreamHandlerConfig(stream=sys.stdout, level=logging.DEBUG))